@@ -410,6 +410,14 @@ class Command(struct.MixedStruct, metaclass=CommandMeta):
         if orig_op is None:
             self.add(op)
 
+    def set_attribute_values(
+        self,
+        values: Mapping[str, Any],
+    ) -> None:
+        """Set the new values of several attributes at once."""
+        for attr_name, value in values.items():
+            self.set_attribute_value(attr_name, value)
+
     def discard_attribute(self, attr_name: str) -> None:
         op = self.get_attribute_set_cmd(attr_name)
         if op is not None:
@@ -20,6 +20,7 @@
 from __future__ import annotations
 from typing import *
 
+import functools
 import hashlib
 
 from edb import errors
@@ -41,6 +42,46 @@ ReferencedInheritingObjectT = TypeVar('ReferencedInheritingObjectT',
                                       bound='ReferencedInheritingObject')
 
 
+@functools.lru_cache(maxsize=None)
+def _get_ref_field_type(
+    referrer_cls: Type[so.Object],
+    attr: str,
+) -> Type[Any]:
+    return referrer_cls.get_field(attr).type
+
+
+@functools.lru_cache(maxsize=None)
+def _get_refdict_and_reftype(
+    referrer_cls: Type[so.Object],
+    mcls: Type[so.Object],
+) -> Tuple[so.RefDict, Type[Any]]:
+    """Return the refdict of *referrer_cls* for *mcls* and its field type.
+
+    Schema classes are never redefined at runtime, so this is safe
+    to memoize for the lifetime of the process.
+    """
+    refdict = referrer_cls.get_refdict_for_class(mcls)
+    reftype = _get_ref_field_type(referrer_cls, refdict.attr)
+    return refdict, reftype
+
+
+@functools.lru_cache(16384, typed=True)
+def _classname_from_name(
+    cmdcls: Type[ReferencedObjectCommand[Any]],
+    name: sn.SchemaName,
+    referrer_name: sn.SchemaName,
+) -> sn.Name:
+    base_name = sn.shortname_from_fullname(name)
+    quals = cmdcls._classname_quals_from_name(name)
+    pnn = sn.get_specialized_name(base_name, referrer_name, *quals)
+    return sn.Name(name=pnn, module=referrer_name.module)
+
+
+@functools.lru_cache(4096)
+def _hash_exprs(exprs: Tuple[str, ...]) -> str:
+    return hashlib.sha1(''.join(exprs).encode()).hexdigest()
+
+
 class ReferencedObject(so.DerivableObject):
 
     #: True if the object has an explicit definition and is not
@@ -113,8 +154,7 @@ class ReferencedObject(so.DerivableObject):
         mcls = type(self)
         referrer_class = type(referrer)
 
-        refdict = referrer_class.get_refdict_for_class(mcls)
-        reftype = referrer_class.get_field(refdict.attr).type
+        refdict, reftype = _get_refdict_and_reftype(referrer_class, mcls)
         refname = reftype.get_key_for_name(schema, derived_name)
         refcoll = referrer.get_field_value(schema, refdict.attr)
         existing = refcoll.get(schema, refname, default=None)
@@ -122,14 +162,13 @@ class ReferencedObject(so.DerivableObject):
         cmdcls: Type[sd.ObjectCommand[so.Object]]
         cmdcls = sd.AlterObject if existing is not None else sd.CreateObject
         cmd = sd.get_object_delta_command(
-            objtype=type(self),
+            objtype=mcls,
             cmdtype=cmdcls,
             schema=schema,
             name=derived_name,
         )
 
-        for k, v in derived_attrs.items():
-            cmd.set_attribute_value(k, v)
+        cmd.set_attribute_values(derived_attrs)
 
         if existing is not None:
             new_bases = derived_attrs['bases']
@@ -137,13 +176,15 @@ class ReferencedObject(so.DerivableObject):
 
             if new_bases != old_bases:
                 assert isinstance(new_bases, so.ObjectList)
+                old_names = tuple(
+                    b.get_name(schema) for b in old_bases.objects(schema))
+                new_names = tuple(
+                    b.get_name(schema) for b in new_bases.objects(schema))
                 removed_bases, added_bases = inheriting.delta_bases(
-                    [b.get_name(schema) for b in old_bases.objects(schema)],
-                    [b.get_name(schema) for b in new_bases.objects(schema)],
-                )
+                    old_names, new_names)
 
                 rebase_cmd = sd.get_object_delta_command(
-                    objtype=type(self),
+                    objtype=mcls,
                     cmdtype=inheriting.RebaseInheritingObject,
                     schema=schema,
                     name=derived_name,
@@ -221,12 +262,24 @@ class ReferencedInheritingObject(
             if not b.generic(schema)
         ]
 
+    def has_implicit_bases(
+        self,
+        schema: s_schema.Schema,
+    ) -> bool:
+        return any(
+            not b.generic(schema)
+            for b in self.get_bases(schema).objects(schema)
+        )
+
 
 class ReferencedObjectCommandMeta(sd.ObjectCommandMeta):
     _transparent_adapter_subclass: ClassVar[bool] = True
     _referrer_context_class: Optional[
         Type[sd.ObjectCommandContext[so.Object]]
     ] = None
+    #: The AST node type used to describe the command outside of
+    #: a referrer context (the second of the astnode list, if any).
+    _ast_node_primary: Optional[Type[qlast.DDLOperation]] = None
 
     def __new__(mcls,
                 name: str,
@@ -242,6 +295,10 @@ class ReferencedObjectCommandMeta(sd.ObjectCommandMeta):
         assert isinstance(cls, ReferencedObjectCommandMeta)
         if referrer_context_class is not None:
             cls._referrer_context_class = referrer_context_class
+        astnode = getattr(cls, 'astnode', None)
+        if isinstance(astnode, (list, tuple)):
+            astnode = astnode[1]
+        cls._ast_node_primary = astnode
         return cls
 
 
@@ -326,10 +383,7 @@ class ReferencedObjectCommand(ReferencedObjectCommandBase[ReferencedT]):
         name: sn.SchemaName,
         referrer_name: sn.SchemaName,
     ) -> sn.Name:
-        base_name = sn.shortname_from_fullname(name)
-        quals = cls._classname_quals_from_name(name)
-        pnn = sn.get_specialized_name(base_name, referrer_name, *quals)
-        return sn.Name(name=pnn, module=referrer_name.module)
+        return _classname_from_name(cls, name, referrer_name)
 
     @classmethod
     def _classname_quals_from_ast(
@@ -353,10 +407,7 @@ class ReferencedObjectCommand(ReferencedObjectCommandBase[ReferencedT]):
     def _name_qual_from_exprs(cls,
                               schema: s_schema.Schema,
                               exprs: Iterable[str]) -> str:
-        m = hashlib.sha1()
-        for expr in exprs:
-            m.update(expr.encode())
-        return m.hexdigest()
+        return _hash_exprs(tuple(exprs))
 
     def _get_ast_node(self,
                       schema: s_schema.Schema,
@@ -369,10 +420,9 @@ class ReferencedObjectCommand(ReferencedObjectCommandBase[ReferencedT]):
         if subject_ctx is not None and ref_astnode is not None:
             return ref_astnode
         else:
-            if isinstance(self.astnode, (list, tuple)):
-                return self.astnode[1]
-            else:
-                return self.astnode
+            astnode = type(self)._ast_node_primary
+            assert astnode is not None
+            return astnode
 
     def _build_alter_cmd_stack(
         self,
@@ -457,8 +507,7 @@ class CreateReferencedObject(
                       ) -> Type[qlast.DDLOperation]:
         scls = self.get_object(schema, context)
         assert isinstance(scls, ReferencedInheritingObject)
-        implicit_bases = scls.get_implicit_bases(schema)
-        if implicit_bases and not context.declarative:
+        if not context.declarative and scls.has_implicit_bases(schema):
             mcls = self.get_schema_metaclass()
             Alter = sd.ObjectCommandMeta.get_command_class_or_die(
                 sd.AlterObject, mcls)
@@ -530,10 +579,11 @@ class CreateReferencedObject(
         context: sd.CommandContext,
         referrer: so.Object,
     ) -> s_schema.Schema:
+        scls = self.scls
         referrer_cls = type(referrer)
-        mcls = type(self.scls)
-        refdict = referrer_cls.get_refdict_for_class(mcls)
-        schema = referrer.add_classref(schema, refdict.attr, self.scls)
+        mcls = type(scls)
+        refdict, _ = _get_refdict_and_reftype(referrer_cls, mcls)
+        schema = referrer.add_classref(schema, refdict.attr, scls)
         return schema
 
 
@@ -567,9 +617,8 @@ class DeleteReferencedObjectCommand(
         scls = self.scls
         referrer_class = type(referrer)
         mcls = type(scls)
-        refdict = referrer_class.get_refdict_for_class(mcls)
-        reftype = referrer_class.get_field(refdict.attr).type
-        refname = reftype.get_key_for(schema, self.scls)
+        refdict, reftype = _get_refdict_and_reftype(referrer_class, mcls)
+        refname = reftype.get_key_for(schema, scls)
 
         return referrer.del_classref(schema, refdict.attr, refname)
 
@@ -592,13 +641,22 @@ class ReferencedInheritingObjectCommand(
 
         assert isinstance(referrer, so.QualifiedObject)
         child_referrer_bases = referrer.get_bases(schema).objects(schema)
-        implicit_bases = []
-        ref_field_type = type(referrer).get_field(referrer_field).type
+        implicit_bases: List[ReferencedInheritingObjectT] = []
+        if not child_referrer_bases:
+            return implicit_bases
+
+        ref_field_type = _get_ref_field_type(type(referrer), referrer_field)
+        get_key_for_name = ref_field_type.get_key_for_name
+        classname_from_name = self._classname_from_name
+        refnames = [
+            get_key_for_name(
+                schema,
+                classname_from_name(fq_name, ref_base.get_name(schema)),
+            )
+            for ref_base in child_referrer_bases
+        ]
 
-        for ref_base in child_referrer_bases:
-            fq_name_in_child = self._classname_from_name(
-                fq_name, ref_base.get_name(schema))
-            refname = ref_field_type.get_key_for_name(schema, fq_name_in_child)
+        for ref_base, refname in zip(child_referrer_bases, refnames):
             parent_coll = ref_base.get_field_value(schema, referrer_field)
             parent_item = parent_coll.get(schema, refname, default=None)
             if (parent_item is not None
@@ -615,18 +673,19 @@ class ReferencedInheritingObjectCommand(
         implicit_bases: List[ReferencedInheritingObjectT],
     ) -> inheriting.BaseDelta_T:
         child_bases = refcls.get_bases(schema).objects(schema)
+        child_names = tuple(b.get_name(schema) for b in child_bases)
 
         default_base = refcls.get_default_base_name()
-        explicit_bases = [
-            b for b in child_bases
-            if b.generic(schema) and b.get_name(schema) != default_base
-        ]
+        explicit_names = tuple(
+            name for b, name in zip(child_bases, child_names)
+            if b.generic(schema) and name != default_base
+        )
 
-        new_bases = implicit_bases + explicit_bases
-        return inheriting.delta_bases(
-            [b.get_name(schema) for b in child_bases],
-            [b.get_name(schema) for b in new_bases],
+        new_names = (
+            tuple(b.get_name(schema) for b in implicit_bases)
+            + explicit_names
         )
+        return inheriting.delta_bases(child_names, new_names)
 
     def _validate(
         self,
@@ -634,21 +693,22 @@ class ReferencedInheritingObjectCommand(
         context: sd.CommandContext
     ) -> None:
         scls = self.scls
-        implicit_bases = [
-            b for b in scls.get_bases(schema).objects(schema)
-            if not b.generic(schema)
-        ]
+        if not context.declarative or not scls.get_is_owned(schema):
+            return
 
         referrer_ctx = self.get_referrer_context_or_die(context)
         objcls = self.get_schema_metaclass()
         referrer_class = referrer_ctx.op.get_schema_metaclass()
         refdict = referrer_class.get_refdict_for_class(objcls)
+        declared_overloaded = self.get_attribute_value('declared_overloaded')
 
-        if context.declarative and scls.get_is_owned(schema):
-            if (implicit_bases
-                    and refdict.requires_explicit_overloaded
-                    and not self.get_attribute_value('declared_overloaded')):
+        if (not declared_overloaded
+                and not refdict.requires_explicit_overloaded):
+            return
 
+        if not declared_overloaded:
+            implicit_bases = scls.get_implicit_bases(schema)
+            if implicit_bases:
                 ancestry = []
 
                 for obj in implicit_bases:
@@ -663,15 +723,13 @@ class ReferencedInheritingObjectCommand(
                     f'{", ".join(a.get_shortname(schema) for a in ancestry)}',
                     context=self.source_context,
                 )
-            elif (not implicit_bases
-                    and self.get_attribute_value('declared_overloaded')):
-
-                raise errors.SchemaDefinitionError(
-                    f'{self.scls.get_verbosename(schema, with_parent=True)}: '
-                    f'cannot be declared `overloaded` as there are no '
-                    f'ancestors defining it.',
-                    context=self.source_context,
-                )
+        elif not scls.has_implicit_bases(schema):
+            raise errors.SchemaDefinitionError(
+                f'{self.scls.get_verbosename(schema, with_parent=True)}: '
+                f'cannot be declared `overloaded` as there are no '
+                f'ancestors defining it.',
+                context=self.source_context,
+            )
 
     def get_implicit_bases(
         self,
@@ -692,13 +750,14 @@ class ReferencedInheritingObjectCommand(
             base_names = [b.get_name(schema) for b in bases]
 
         # Filter out explicit bases
+        shortname_from_fullname = sn.shortname_from_fullname
         implicit_bases = [
             b
             for b in base_names
             if (
                 b != default_base
                 and isinstance(b, sn.SchemaName)
-                and sn.shortname_from_fullname(b) != b
+                and shortname_from_fullname(b) != b
             )
         ]
 
@@ -718,15 +777,18 @@ class ReferencedInheritingObjectCommand(
             ):
                 return schema
 
+        descendants = scls.ordered_descendants(schema)
+        if not descendants:
+            return schema
+
         referrer_ctx = self.get_referrer_context_or_die(context)
         referrer = referrer_ctx.scls
         referrer_class = type(referrer)
         mcls = type(scls)
-        refdict = referrer_class.get_refdict_for_class(mcls)
-        reftype = referrer_class.get_field(refdict.attr).type
+        refdict, reftype = _get_refdict_and_reftype(referrer_class, mcls)
         refname = reftype.get_key_for(schema, self.scls)
 
-        for descendant in scls.ordered_descendants(schema):
+        for descendant in descendants:
             d_alter_cmd = descendant.init_delta_command(schema, sd.AlterObject)
             assert isinstance(descendant, ReferencedObject)
             d_alter_cmd.ref_op_propagated = True
@@ -755,8 +817,7 @@ class ReferencedInheritingObjectCommand(
         refs = scls.get_field_value(schema, refdict.attr)
 
         for ref in refs.objects(schema):
-            inherited = ref.get_implicit_bases(schema)
-            if inherited and ref.get_is_owned(schema):
+            if ref.get_is_owned(schema) and ref.has_implicit_bases(schema):
                 drop_owned = ref.init_delta_command(schema, AlterOwned)
                 drop_owned.set_attribute_value('is_owned', False)
                 alter = ref.init_delta_command(schema, sd.AlterObject)
@@ -819,15 +880,15 @@ class CreateReferencedInheritingObject(
                     schema, context, parent_node=parent_node)
 
                 if context.declarative:
-                    scls = self.get_object(schema, context)
-                    assert isinstance(scls, ReferencedInheritingObject)
-                    implicit_bases = scls.get_implicit_bases(schema)
                     objcls = self.get_schema_metaclass()
                     referrer_class = refctx.op.get_schema_metaclass()
                     refdict = referrer_class.get_refdict_for_class(objcls)
-                    if refdict.requires_explicit_overloaded and implicit_bases:
-                        assert astnode is not None
-                        astnode.declared_overloaded = True
+                    if refdict.requires_explicit_overloaded:
+                        scls = self.get_object(schema, context)
+                        assert isinstance(scls, ReferencedInheritingObject)
+                        if scls.has_implicit_bases(schema):
+                            assert astnode is not None
+                            astnode.declared_overloaded = True
 
                 return astnode
         else:
@@ -855,11 +916,12 @@ class CreateReferencedInheritingObject(
                 if implicit_bases:
                     bases = self.get_attribute_value('bases')
                     if bases:
+                        implicit_ids = {b.id for b in implicit_bases}
                         bases = so.ObjectList.create(
                             schema,
                             implicit_bases + [
                                 b for b in bases.objects(schema)
-                                if b not in implicit_bases
+                                if b.id not in implicit_ids
                             ],
                         )
                     else:
@@ -903,9 +965,14 @@ class CreateReferencedInheritingObject(
         referrer: so.InheritingObject,
     ) -> s_schema.Schema:
 
+        children = referrer.children(schema)
+        if not children:
+            return schema
+
         get_cmd = sd.ObjectCommandMeta.get_command_class_or_die
 
-        mcls = type(self.scls)
+        scls = self.scls
+        mcls = type(scls)
         referrer_cls = type(referrer)
         alter_cmd = get_cmd(sd.AlterObject, referrer_cls)
         ref_create_cmd = get_cmd(sd.CreateObject, mcls)
@@ -913,10 +980,10 @@ class CreateReferencedInheritingObject(
         ref_rebase_cmd = get_cmd(inheriting.RebaseInheritingObject, mcls)
         assert issubclass(ref_create_cmd, CreateReferencedInheritingObject)
         assert issubclass(ref_rebase_cmd, RebaseReferencedInheritingObject)
-        refdict = referrer_cls.get_refdict_for_class(mcls)
-        parent_fq_refname = self.scls.get_name(schema)
+        refdict, _ = _get_refdict_and_reftype(referrer_cls, mcls)
+        parent_fq_refname = scls.get_name(schema)
 
-        for child in referrer.children(schema):
+        for child in children:
             if not child.allow_ref_propagation(schema, context, refdict):
                 continue
 
@@ -924,12 +991,12 @@ class CreateReferencedInheritingObject(
             with alter.new_context(schema, context, child):
                 # This is needed to get the correct inherited name which will
                 # either be created or rebased.
-                ref_field_type = type(child).get_field(refdict.attr).type
+                ref_field_type = _get_ref_field_type(type(child), refdict.attr)
                 refname = ref_field_type.get_key_for_name(
                     schema, parent_fq_refname)
 
                 astnode = ref_create_cmd.as_inherited_ref_ast(
-                    schema, context, refname, self.scls)
+                    schema, context, refname, scls)
                 fq_name = self._classname_from_ast(schema, astnode, context)
 
                 # We cannot check for ref existence in this child at this
@@ -938,7 +1005,7 @@ class CreateReferencedInheritingObject(
                 # containing Alter(if_exists) and Create(if_not_exists)
                 # to postpone that check until the application time.
                 ref_create = ref_create_cmd.as_inherited_ref_cmd(
-                    schema, context, astnode, [self.scls])
+                    schema, context, astnode, [scls])
                 ref_create.if_not_exists = True
 
                 ref_create.set_attribute_value(refdict.backref_attr, child)
@@ -1009,8 +1076,7 @@ class AlterReferencedInheritingObject(
         scls = self.scls
         was_local = scls.get_is_owned(schema)
         schema = super()._alter_begin(schema, context)
-        now_local = scls.get_is_owned(schema)
-        if not was_local and now_local:
+        if not was_local and scls.get_is_owned(schema):
             self._validate(schema, context)
         return schema
 
@@ -1063,8 +1129,9 @@ class RebaseReferencedInheritingObject(
         bases: Tuple[so.ObjectShell, ...],
     ) -> Tuple[so.ObjectShell, ...]:
         bases = super()._get_bases_for_ast(schema, context, bases)
-        implicit_bases = set(self.get_implicit_bases(schema, context, bases))
-        return tuple(b for b in bases if b.name not in implicit_bases)
+        implicit_names = frozenset(
+            self.get_implicit_bases(schema, context, bases))
+        return tuple(b for b in bases if b.name not in implicit_names)
 
 
 class RenameReferencedInheritingObject(
@@ -1081,8 +1148,11 @@ class RenameReferencedInheritingObject(
         scls = self.scls
 
         if not context.canonical and not scls.generic(schema):
-            implicit_bases = scls.get_implicit_bases(schema)
-            non_renamed_bases = set(implicit_bases) - context.renamed_objs
+            renamed_objs = context.renamed_objs
+            non_renamed_bases = [
+                b for b in scls.get_implicit_bases(schema)
+                if b not in renamed_objs
+            ]
 
             # This object is inherited from one or more ancestors that
             # are not renamed in the same op, and this is an error.
@@ -1148,27 +1218,23 @@ class DeleteReferencedInheritingObject(
         scls = self.scls
         referrer_class = type(referrer)
         mcls = type(scls)
-        refdict = referrer_class.get_refdict_for_class(mcls)
-        reftype = referrer_class.get_field(refdict.attr).type
-        refname = reftype.get_key_for(schema, self.scls)
-        self_name = self.scls.get_name(schema)
+        refdict, reftype = _get_refdict_and_reftype(referrer_class, mcls)
+        refname = reftype.get_key_for(schema, scls)
+        self_name = scls.get_name(schema)
 
         schema = referrer.del_classref(schema, refdict.attr, refname)
 
         if (isinstance(referrer, so.InheritingObject)
                 and not context.canonical):
 
-            if (not context.in_deletion(offset=1)
-                    and not context.disable_dep_verification):
-                implicit_bases = set(self._get_implicit_ref_bases(
-                    schema, context, referrer, refdict.attr, self_name))
-
-                deleted_bases = set()
-                for ctx in context.stack:
-                    if isinstance(ctx.op, type(self)):
-                        deleted_bases.add(ctx.op.scls)
-
-                implicit_bases -= deleted_bases
+            if (not context.disable_dep_verification
+                    and not context.in_deletion(offset=1)):
+                # No deletion encloses this one, so the only deletion
+                # on the context stack is our own, and our object cannot
+                # be among its own implicit bases.  There is nothing to
+                # discount here.
+                implicit_bases = self._get_implicit_ref_bases(
+                    schema, context, referrer, refdict.attr, self_name)
 
                 if implicit_bases:
                     # Cannot remove inherited objects.
@@ -1281,16 +1347,12 @@ class AlterOwned(
         schema = super()._alter_begin(schema, context)
         scls = self.scls
 
-        orig_owned = scls.get_is_owned(orig_schema)
-        owned = scls.get_is_owned(schema)
-
         if (
-            orig_owned != owned
-            and not owned
+            scls.get_is_owned(orig_schema)
+            and not scls.get_is_owned(schema)
             and not context.canonical
         ):
-            implicit_bases = scls.get_implicit_bases(schema)
-            if not implicit_bases:
+            if not scls.has_implicit_bases(schema):
                 # ref isn't actually inherited, so cannot be un-owned
                 vn = scls.get_verbosename(schema, with_parent=True)
                 sn = type(scls).get_schema_class_displayname().upper()
@@ -33,6 +33,11 @@ from edb.server import cluster
 from . import server
 
 
+# urllib.request.Request copies the headers it is given,
+# so a single dict can be shared by all requests.
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
 class StubbornHttpConnection(http.client.HTTPConnection):
 
     def close(self):
@@ -104,6 +109,16 @@ class BaseHttpTest:
         self.http_con_send_request(con, params, path=path)
         return self.http_con_read_response(con)
 
+    def http_post_json(self, req_data: dict):
+        req = urllib.request.Request(
+            self.http_addr,
+            data=json.dumps(req_data).encode(),
+            headers=_JSON_HEADERS,
+            method='POST',
+        )
+        response = urllib.request.urlopen(req)
+        return json.loads(response.read())
+
 
 class EdgeQLTestCase(BaseHttpTest, server.QueryTestCase):
 
@@ -119,11 +134,7 @@ class EdgeQLTestCase(BaseHttpTest, server.QueryTestCase):
         if use_http_post:
             if variables is not None:
                 req_data['variables'] = variables
-            req = urllib.request.Request(self.http_addr, method='POST')
-            req.add_header('Content-Type', 'application/json')
-            response = urllib.request.urlopen(
-                req, json.dumps(req_data).encode())
-            resp_data = json.loads(response.read())
+            resp_data = self.http_post_json(req_data)
         else:
             if variables is not None:
                 req_data['variables'] = json.dumps(variables)
@@ -179,11 +190,7 @@ class GraphQLTestCase(BaseHttpTest, server.QueryTestCase):
         if use_http_post:
             if variables is not None:
                 req_data['variables'] = variables
-            req = urllib.request.Request(self.http_addr, method='POST')
-            req.add_header('Content-Type', 'application/json')
-            response = urllib.request.urlopen(
-                req, json.dumps(req_data).encode())
-            resp_data = json.loads(response.read())
+            resp_data = self.http_post_json(req_data)
         else:
             if variables is not None:
                 req_data['variables'] = json.dumps(variables)
@@ -196,7 +203,7 @@ class GraphQLTestCase(BaseHttpTest, server.QueryTestCase):
 
         err = resp_data['errors'][0]
 
-        typename, msg = err['message'].split(':', 1)
+        typename, _, msg = err['message'].partition(':')
         msg = msg.strip()
 
         try:
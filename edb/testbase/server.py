@@ -29,6 +29,7 @@ import functools
 import inspect
 import json
 import math
+import operator
 import os
 import pprint
 import re
@@ -366,11 +367,14 @@ class ConnectedTestCaseMixin:
             raise
 
     def _sort_results(self, results, sort):
+        # sort can be True (sort the items as they are), the name of
+        # the key to sort the items by, a key function or a dict
         if sort is True:
-            sort = lambda x: x
+            sort = None
+        elif isinstance(sort, str):
+            sort = operator.itemgetter(sort)
         # don't bother sorting empty things
         if results:
-            # sort can be either a key function or a dict
             if isinstance(sort, dict):
                 # the keys in the dict indicate the fields that
                 # actually must be sorted
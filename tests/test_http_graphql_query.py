@@ -146,7 +146,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     'name': 'template',
                     'value': 'blue',
                 }],
-            }, sort=lambda x: x['name'])
+            }, sort='name')
 
     def test_graphql_functional_query_02(self):
         self.assert_graphql_query_result(r"""
@@ -211,7 +211,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
             }, {
                 'name': 'template',
             }],
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_query_04(self):
         self.assert_graphql_query_result(r"""
@@ -311,7 +311,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     'name': 'template',
                 }],
             },
-            sort=lambda x: x['name'],
+            sort='name',
             operation_name='names'
         )
 
@@ -336,7 +336,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     'value': 'full',
                 }],
             },
-            sort=lambda x: x['value'],
+            sort='value',
             operation_name='values',
             use_http_post=False
         )
@@ -587,7 +587,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     },
                 ],
             },
-            sort=lambda x: x['name']
+            sort='name'
         )
 
     def test_graphql_functional_alias_02(self):
@@ -627,7 +627,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     },
                 ],
             },
-            sort=lambda x: x['name']
+            sort='name'
         )
 
     def test_graphql_functional_alias_03(self):
@@ -672,7 +672,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     },
                 ],
             },
-            sort=lambda x: x['name']
+            sort='name'
         )
 
     def test_graphql_functional_alias_04(self):
@@ -874,7 +874,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
             'User': [
                 {'name': 'John', 'age': 25},
             ],
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_arguments_08(self):
         self.assert_graphql_query_result(r"""
@@ -894,7 +894,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
             'User': [
                 {'name': 'John', 'score': 3.14},
             ],
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_arguments_09(self):
         self.assert_graphql_query_result(r"""
@@ -911,7 +911,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
             'User': [
                 {'name': 'Jane', 'age': 25},
             ],
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_arguments_10(self):
         self.assert_graphql_query_result(r"""
@@ -1533,7 +1533,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                 {"age": None, "name": "template", "score": None},
                 {"age": None, "name": "upgraded", "score": None},
             ]
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_fragment_type_07(self):
         self.assert_graphql_query_result(r"""
@@ -1559,7 +1559,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                 {"id": uuid.UUID, "name": "template"},
                 {"id": uuid.UUID, "name": "upgraded"},
             ]
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_fragment_type_08(self):
         with self.assertRaisesRegex(
@@ -1626,7 +1626,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                 {"id": uuid.UUID, "name": "template", "age": None},
                 {"id": uuid.UUID, "name": "upgraded", "age": None},
             ]
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_fragment_type_11(self):
         self.assert_graphql_query_result(r"""
@@ -1652,7 +1652,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                 {"id": uuid.UUID, "name": "Jane", "age": 25},
                 {"id": uuid.UUID, "name": "John", "age": 25},
             ]
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_fragment_type_12(self):
         self.assert_graphql_query_result(r"""
@@ -1881,7 +1881,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                     '__typename': 'UserGroup_Type',
                 }]
             }],
-        }, sort=lambda x: x['name'])
+        }, sort='name')
 
     def test_graphql_functional_typename_02(self):
         self.assert_graphql_query_result(r"""
@@ -2880,7 +2880,7 @@ class TestGraphQLFunctional(tb.GraphQLTestCase):
                 '__typename': 'Bar2_Type',
                 'q': 'bar2',
             }],
-        }, sort=lambda x: x['q'])
+        }, sort='q')
 
     def test_graphql_functional_inheritance_02(self):
         # ISSUE: #709